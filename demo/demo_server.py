@@ -1,24 +1,62 @@
 import asyncio
-import json
+import logging
+import struct
+import numpy as np
+import orjson
 import uvicorn
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 import cogops_core as openrustswarm_internal
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI()
 
+AGENT_COUNT = 1000
+
+# Simulation cadence (~20 ticks/s), decoupled from how fast the client drains
+TICK_INTERVAL_S = 0.05
+
+# WebSocket batching: a state is sent as soon as the socket is free; states
+# that pile up while a send is in flight go out together, up to BATCH_MAX_SIZE
+# per frame.
+BATCH_MAX_SIZE = 4
+
+# Caste codes shipped in the "c" column (must match CASTE_* in index.html).
+# Ordered by share probability so that digitizing against CASTE_EDGES
+# yields the code directly: < 0.3 selfish, > 0.7 broker, else neutral.
+# The upper edge sits one float32 step above 0.7 so that exactly 0.7 stays
+# neutral under digitize's half-open [lo, hi) bins.
+CASTE_SELFISH = 0
+CASTE_NEUTRAL = 1
+CASTE_BROKER = 2
+CASTE_EDGES = np.array(
+    [0.3, np.nextafter(np.float32(0.7), np.float32(1))], dtype=np.float32
+)
+
+# Binary wire format (little-endian), decoded by applyBatch() in index.html:
+#   batch := u32 frame_count, frame*
+#   frame := u32 tick, u32 n, f32 mean_health, f32 mean_surprise,
+#            f32 xs[n], f32 ys[n], u8 c[n], pad to 4 bytes
+# Locations change rarely, so they travel as separate JSON text messages.
+BATCH_HEADER = struct.Struct("<I")
+FRAME_HEADER = struct.Struct("<IIff")
+
 # Mount the static frontend
 app.mount("/demo", StaticFiles(directory="demo", html=True), name="demo")
 
 class DemoSession:
     def __init__(self):
+        # Bumped whenever the location lists change so senders know to resync
+        self.locations_version = 0
         self.reset()
         self.running = True
 
     def reset(self):
-        # Initialize 1000 agents in a 1000x1000 grid
+        # Initialize AGENT_COUNT agents in a 1000x1000 grid
         world_config = openrustswarm_internal.WorldModelConfig(ebbinghaus_decay_rate=0.1, grid_size=(1000, 1000))
-        self.swarm = cogops.ProductionTensorSwarm(agent_count=1000, world_config=world_config)
+        self.swarm = openrustswarm_internal.ProductionTensorSwarm(agent_count=AGENT_COUNT, world_config=world_config)
+        self._alloc_frame(AGENT_COUNT)
         
         self.villages = []
         self.cities = []
@@ -26,8 +64,25 @@ class DemoSession:
         self._update_locations()
         self.tick_count = 0
 
+    def _alloc_frame(self, n):
+        # Reusable frame buffer; get_state() fills it in place through these views
+        self._frame = bytearray(FRAME_HEADER.size + 8 * n + n + (-n % 4))
+        self._frame_positions = np.frombuffer(
+            self._frame, dtype=np.float32, count=2 * n, offset=FRAME_HEADER.size
+        ).reshape(2, n)
+        self._frame_castes = np.frombuffer(
+            self._frame, dtype=np.uint8, count=n, offset=FRAME_HEADER.size + 8 * n
+        )
+
     def _update_locations(self):
-        self.swarm.register_locations(self.villages, [], self.cities, self.ambush_zones)
+        # Deferred to flush_locations() so bursts of clicks cost one engine call
+        self.locations_version += 1
+        self._locations_dirty = True
+
+    def flush_locations(self):
+        if self._locations_dirty:
+            self.swarm.register_locations(self.villages, [], self.cities, self.ambush_zones)
+            self._locations_dirty = False
 
     def place_village(self, x, y):
         self.villages.append((float(x), float(y)))
@@ -44,90 +99,123 @@ class DemoSession:
     def apply_shock(self, x, y, radius=50.0):
         self.swarm.apply_environmental_shock((float(x), float(y)), float(radius), 1.0)
 
-    def get_state(self):
-        # Extract raw arrays from the Rust engine
-        positions = self.swarm.get_all_positions()
-        healths = self.swarm.get_all_health()
-        share_probs = self.swarm.get_all_share_probabilities()
-        metrics = self.swarm.sample_population_metrics()
-
-        # Format agent data
-        agents = []
-        for i in range(len(positions)):
-            x, y = positions[i]
-            sp = share_probs[i]
-            
-            # Determine caste based on TD-RL share probability
-            if sp > 0.7: caste = "broker"
-            elif sp < 0.3: caste = "selfish"
-            else: caste = "neutral"
-
-            agents.append({
-                "x": round(x, 1),
-                "y": round(y, 1),
-                "h": round(healths[i], 2),
-                "c": caste
-            })
-
+    def get_locations(self):
         return {
-            "type": "state",
-            "tick": self.tick_count,
-            "agents": agents,
+            "type": "locations",
             "villages": self.villages,
             "cities": self.cities,
             "ambushes": self.ambush_zones,
-            "mean_health": round(sum(healths)/len(healths), 3) if healths else 0,
-            "mean_surprise": round(metrics.get("mean_surprise_score", 0), 3)
         }
 
+    def get_state(self):
+        # Extract raw float32 columns (SoA) from the Rust engine as NumPy arrays
+        positions = self.swarm.get_all_positions_np()  # shape (2, n): xs, ys
+        share_probs = self.swarm.get_all_share_probabilities_np()
+        metrics = self.swarm.sample_population_metrics()
+
+        FRAME_HEADER.pack_into(
+            self._frame,
+            0,
+            self.tick_count,
+            share_probs.size,
+            metrics.get("mean_health", 0),
+            metrics.get("mean_surprise_score", 0),
+        )
+        self._frame_positions[...] = positions
+        # Caste from TD-RL share probability, as a code the frontend looks up
+        self._frame_castes[...] = np.digitize(share_probs, CASTE_EDGES)
+
+        # Snapshot: queued frames must not alias the buffer reused next tick
+        return bytes(self._frame)
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
     session = DemoSession()
+    # Hand-off between the tick loop and the sender. Bounded: when the client
+    # falls behind, the oldest undelivered states are dropped so physics
+    # never waits on network I/O.
+    states = asyncio.Queue(maxsize=BATCH_MAX_SIZE)
     
     # Task to read commands from client
     async def receive_commands():
         try:
             while True:
                 data = await websocket.receive_text()
-                cmd = json.loads(data)
-                action = cmd.get("action")
-                payload = cmd.get("payload", {})
+                # A malformed command must not tear down the session (and the
+                # client's placed locations with it); log it and keep reading
+                try:
+                    cmd = orjson.loads(data)
+                    action = cmd.get("action")
+                    payload = cmd.get("payload", {})
                 
-                if action == "reset":
-                    session.reset()
-                elif action == "pause":
-                    session.running = False
-                elif action == "resume":
-                    session.running = True
-                elif action == "place_village":
-                    session.place_village(payload["x"], payload["y"])
-                elif action == "place_city":
-                    session.place_city(payload["x"], payload["y"])
-                elif action == "place_ambush":
-                    session.place_ambush(payload["x"], payload["y"])
-                elif action == "shock":
-                    session.apply_shock(payload["x"], payload["y"], payload.get("radius", 50.0))
+                    if action == "reset":
+                        session.reset()
+                    elif action == "pause":
+                        session.running = False
+                    elif action == "resume":
+                        session.running = True
+                    elif action == "place_village":
+                        session.place_village(payload["x"], payload["y"])
+                    elif action == "place_city":
+                        session.place_city(payload["x"], payload["y"])
+                    elif action == "place_ambush":
+                        session.place_ambush(payload["x"], payload["y"])
+                    elif action == "shock":
+                        session.apply_shock(payload["x"], payload["y"], payload.get("radius", 50.0))
+                except Exception:
+                    logger.exception("Ignoring failed command: %r", data)
         except WebSocketDisconnect:
             pass
 
-    receiver_task = asyncio.create_task(receive_commands())
-
-    try:
+    # Task to advance the simulation at its own cadence, independent of sends
+    async def produce_states():
         while True:
             if session.running:
+                session.flush_locations()
                 session.swarm.tick()
                 session.tick_count += 1
-                
-                # Send state snapshot at 20Hz
-                state = session.get_state()
-                await websocket.send_text(json.dumps(state))
-                
-                await asyncio.sleep(0.05) # ~20 FPS
+                if states.full():
+                    states.get_nowait()
+                states.put_nowait(session.get_state())
+                await asyncio.sleep(TICK_INTERVAL_S)
             else:
                 await asyncio.sleep(0.1)
-    except WebSocketDisconnect:
-        receiver_task.cancel()
+
+    # Task to drain queued states and send them as a single batch frame
+    async def send_batches():
+        locations_sent = None
+        try:
+            while True:
+                # Block for the next state, then take only what is already
+                # queued (states that arrived while the last send was in flight)
+                frames = [await states.get()]
+                while len(frames) < BATCH_MAX_SIZE:
+                    try:
+                        frames.append(states.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                if locations_sent != session.locations_version:
+                    locations_sent = session.locations_version
+                    await websocket.send_text(orjson.dumps(session.get_locations()).decode())
+                await websocket.send_bytes(BATCH_HEADER.pack(len(frames)) + b"".join(frames))
+        except WebSocketDisconnect:
+            pass
+
+    tasks = [
+        asyncio.create_task(receive_commands()),
+        asyncio.create_task(produce_states()),
+        asyncio.create_task(send_batches()),
+    ]
+    try:
+        # Any task finishing means the client went away or the session failed
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is not None:
+                logger.error("Demo session failed", exc_info=task.exception())
+    finally:
+        for task in tasks:
+            task.cancel()
 
 if __name__ == "__main__":
     print("Starting CogOps Demo Server on http://0.0.0.0:8080/demo/")
@@ -44,20 +44,29 @@ if __name__ == "__main__":
     else:
         print("10M scale looks safe for 32GB RAM.")
 
-    # 3. Test extraction overhead
+    # 3. Test extraction overhead: Python list vs NumPy array
     print("\nTESTING EXTRACTION OVERHEAD (1M Agents)")
     t2 = time.perf_counter()
     health = swarm.get_all_health()
     t3 = time.perf_counter()
-    list_mem = sys.getsizeof(health) / 1024 / 1024
+    # getsizeof(list) only counts the pointer array; every element is its own float object
+    list_mem = (sys.getsizeof(health) + len(health) * sys.getsizeof(0.0)) / 1024 / 1024
     print(f"   List Extraction Time (1M): {t3 - t2:.4f}s")
     print(f"   Python List Memory:        {list_mem:.2f} MB")
     print(f"   Estimated 10M List Memory: {list_mem * 10:.2f} MB")
 
+    t4 = time.perf_counter()
+    health_np = swarm.get_all_health_np()
+    t5 = time.perf_counter()
+    np_mem = health_np.nbytes / 1024 / 1024
+    print(f"   NumPy Extraction Time (1M): {t5 - t4:.4f}s")
+    print(f"   NumPy Array Memory:         {np_mem:.2f} MB")
+    print(f"   Estimated 10M Array Memory: {np_mem * 10:.2f} MB")
+
     # 4. Test Smart Metrics (O(1) transfer)
     print("\nTESTING SMART METRICS (O(1) Overhead)")
-    t4 = time.perf_counter()
+    t6 = time.perf_counter()
     metrics = swarm.sample_population_metrics()
-    t5 = time.perf_counter()
-    print(f"   Metrics Time: {t5 - t4:.6f}s")
+    t7 = time.perf_counter()
+    print(f"   Metrics Time: {t7 - t6:.6f}s")
     print(f"   Mean Health (from Rust): {metrics.get('mean_health', 0):.4f}")
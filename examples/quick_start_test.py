@@ -1,3 +1,4 @@
+import numpy as np
 import openrustswarm_core as ors
 
 # Initialize 1,000 agents
@@ -19,8 +20,8 @@ for i in range(100):
         print(f"  Tick {i} complete")
 
 # Verify health output
-health = swarm.get_all_health()
-mean_health = sum(health) / len(health)
+health = swarm.get_all_health_np()
+mean_health = float(np.mean(health))
 print(f"\nFinal Statistics:")
 print(f"  Agent Count: {len(health)}")
 print(f"  Mean Health: {mean_health:.3f}")
@@ -2,6 +2,7 @@
 //!
 //! Queues high-risk actions for human approval before execution.
 
+use aho_corasick::AhoCorasick;
 use parking_lot::RwLock;
 use pyo3::prelude::*;
 use serde::{Deserialize, Serialize};
@@ -93,31 +94,39 @@ pub struct EscalationFlow {
     pending_queue: RwLock<VecDeque<PendingAction>>,
     high_risk_patterns: Vec<String>,
     critical_patterns: Vec<String>,
+    /// Single-pass matcher over critical then high-risk patterns; pattern IDs
+    /// follow that order, so the lowest matched ID is the highest-priority hit.
+    pattern_matcher: AhoCorasick,
 }
 
 #[pymethods]
 impl EscalationFlow {
     #[new]
     pub fn new() -> Self {
+        let high_risk_patterns = vec![
+            "delete".to_string(),
+            "drop".to_string(),
+            "remove".to_string(),
+            "send_email".to_string(),
+            "transfer".to_string(),
+            "payment".to_string(),
+        ];
+        let critical_patterns = vec![
+            "sudo".to_string(),
+            "rm -rf".to_string(),
+            "format".to_string(),
+            "shutdown".to_string(),
+            "api_key".to_string(),
+            "password".to_string(),
+            "credential".to_string(),
+        ];
+        let pattern_matcher = AhoCorasick::new(critical_patterns.iter().chain(&high_risk_patterns))
+            .expect("Failed to build escalation pattern matcher");
         let flow = EscalationFlow {
             pending_queue: RwLock::new(VecDeque::new()),
-            high_risk_patterns: vec![
-                "delete".to_string(),
-                "drop".to_string(),
-                "remove".to_string(),
-                "send_email".to_string(),
-                "transfer".to_string(),
-                "payment".to_string(),
-            ],
-            critical_patterns: vec![
-                "sudo".to_string(),
-                "rm -rf".to_string(),
-                "format".to_string(),
-                "shutdown".to_string(),
-                "api_key".to_string(),
-                "password".to_string(),
-                "credential".to_string(),
-            ],
+            high_risk_patterns,
+            critical_patterns,
+            pattern_matcher,
         };
         info!(
             "🚨 [Escalation] Initialized with {} high-risk, {} critical patterns",
@@ -129,46 +138,34 @@ impl EscalationFlow {
 
     /// Check if an action needs escalation
     pub fn check(&self, agent_id: String, action: String, data: String) -> EscalationResult {
-        let action_lower = action.to_lowercase();
-        let data_lower = data.to_lowercase();
-        let combined = format!("{} {}", action_lower, data_lower);
+        // Case-fold once over the joined text rather than per part
+        let combined = format!("{} {}", action, data).to_lowercase();
 
-        // Check for critical patterns
-        for pattern in &self.critical_patterns {
-            if combined.contains(pattern) {
-                let pending = self.queue_action(
-                    &agent_id,
-                    &action,
-                    &data,
-                    "Critical",
-                    &format!("Contains critical pattern: {}", pattern),
-                );
-                return EscalationResult {
-                    needs_approval: true,
-                    risk_level: "Critical".to_string(),
-                    reason: format!("Action contains critical pattern: {}", pattern),
-                    pending_id: Some(pending.id),
-                };
-            }
-        }
-
-        // Check for high-risk patterns
-        for pattern in &self.high_risk_patterns {
-            if combined.contains(pattern) {
-                let pending = self.queue_action(
-                    &agent_id,
-                    &action,
-                    &data,
+        // Critical patterns take precedence over high-risk ones
+        if let Some(idx) = self.first_matching_pattern(&combined) {
+            let n_critical = self.critical_patterns.len();
+            let (risk, kind, pattern) = if idx < n_critical {
+                ("Critical", "critical", &self.critical_patterns[idx])
+            } else {
+                (
                     "High",
-                    &format!("Contains high-risk pattern: {}", pattern),
-                );
-                return EscalationResult {
-                    needs_approval: true,
-                    risk_level: "High".to_string(),
-                    reason: format!("Action contains high-risk pattern: {}", pattern),
-                    pending_id: Some(pending.id),
-                };
-            }
+                    "high-risk",
+                    &self.high_risk_patterns[idx - n_critical],
+                )
+            };
+            let pending = self.queue_action(
+                &agent_id,
+                &action,
+                &data,
+                risk,
+                &format!("Contains {} pattern: {}", kind, pattern),
+            );
+            return EscalationResult {
+                needs_approval: true,
+                risk_level: risk.to_string(),
+                reason: format!("Action contains {} pattern: {}", kind, pattern),
+                pending_id: Some(pending.id),
+            };
         }
 
         // Auto-approve low-risk actions
@@ -227,6 +224,15 @@ impl EscalationFlow {
 }
 
 impl EscalationFlow {
+    /// Index into critical ++ high-risk patterns of the first (highest-priority)
+    /// pattern occurring in `text`, found in one pass over the text.
+    fn first_matching_pattern(&self, text: &str) -> Option<usize> {
+        self.pattern_matcher
+            .find_overlapping_iter(text)
+            .map(|m| m.pattern().as_usize())
+            .min()
+    }
+
     fn queue_action(
         &self,
         agent_id: &str,
@@ -269,3 +275,45 @@ impl Default for EscalationFlow {
         Self::new()
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn check(action: &str, data: &str) -> EscalationResult {
+        EscalationFlow::new().check("agent-1".to_string(), action.to_string(), data.to_string())
+    }
+
+    #[test]
+    fn critical_pattern_outranks_high_risk() {
+        let result = check("delete", "the password");
+        assert!(result.needs_approval);
+        assert_eq!(result.risk_level, "Critical");
+        assert_eq!(result.reason, "Action contains critical pattern: password");
+    }
+
+    #[test]
+    fn earliest_listed_pattern_wins_within_a_tier() {
+        // Reported pattern follows list order, not position in the text
+        let result = check("reset PASSWORD", "then Format disk");
+        assert_eq!(result.risk_level, "Critical");
+        assert_eq!(result.reason, "Action contains critical pattern: format");
+
+        let result = check("Transfer funds", "and drop the log");
+        assert_eq!(result.risk_level, "High");
+        assert_eq!(result.reason, "Action contains high-risk pattern: drop");
+    }
+
+    #[test]
+    fn benign_action_is_auto_approved() {
+        let flow = EscalationFlow::new();
+        let result = flow.check(
+            "agent-1".to_string(),
+            "read".to_string(),
+            "report".to_string(),
+        );
+        assert!(!result.needs_approval);
+        assert_eq!(result.risk_level, "Low");
+        assert_eq!(flow.pending_count(), 0);
+    }
+}
@@ -8,7 +8,7 @@
 //! - API keys
 
 use pyo3::prelude::*;
-use regex::Regex;
+use regex::{Regex, RegexSet};
 use std::sync::LazyLock;
 
 /// PII pattern definitions
@@ -69,6 +69,35 @@ static DEMOGRAPHIC_PATTERN: LazyLock<Option<Regex>> =
 static GPS_PATTERN: LazyLock<Option<Regex>> =
     LazyLock::new(|| Regex::new(r"\b-?\d{1,3}\.\d{4,},\s*-?\d{1,3}\.\d{4,}\b").ok());
 
+/// Every PII pattern with its type label, in detection order
+static PII_PATTERNS: [(&str, &LazyLock<Option<Regex>>); 15] = [
+    ("Email", &EMAIL_PATTERN),
+    ("Phone", &PHONE_PATTERN),
+    ("SSN", &SSN_PATTERN),
+    ("CreditCard", &CREDIT_CARD_PATTERN),
+    ("APIKey", &API_KEY_PATTERN),
+    ("Address", &ADDRESS_PATTERN),
+    ("DOB", &DOB_PATTERN),
+    ("Passport", &PASSPORT_PATTERN),
+    ("Biometric", &BIOMETRIC_PATTERN),
+    ("DriversLicense", &DRIVERS_LICENSE_PATTERN),
+    ("BankAccount", &BANK_ACCOUNT_PATTERN),
+    ("Medical", &MEDICAL_PATTERN),
+    ("DigitalID", &DIGITAL_ID_PATTERN),
+    ("Demographic", &DEMOGRAPHIC_PATTERN),
+    ("GPS", &GPS_PATTERN),
+];
+
+/// All of `PII_PATTERNS` as one set, used to skip patterns absent from the text.
+/// `None` if any pattern failed to compile (detection then scans every pattern).
+static PII_PREFILTER: LazyLock<Option<RegexSet>> = LazyLock::new(|| {
+    let sources: Option<Vec<&str>> = PII_PATTERNS
+        .iter()
+        .map(|(_, pattern)| pattern.as_ref().map(|re| re.as_str()))
+        .collect();
+    RegexSet::new(sources?).ok()
+});
+
 /// PII detection result
 #[derive(Debug, Clone)]
 #[pyclass]
@@ -111,183 +140,25 @@ impl PIIRedactor {
     pub fn detect_pii(&self, text: &str) -> Vec<PIIMatch> {
         let mut matches = Vec::new();
 
-        // Email
-        if let Some(pattern) = EMAIL_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "Email".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
-            }
-        }
-
-        // Phone
-        if let Some(pattern) = PHONE_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "Phone".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
-            }
-        }
-
-        // SSN
-        if let Some(pattern) = SSN_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "SSN".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
-            }
-        }
+        // One pass over the text to find which pattern types occur at all;
+        // only those are then re-run to extract match positions.
+        let present = PII_PREFILTER.as_ref().map(|set| set.matches(text));
 
-        // Credit Card
-        if let Some(pattern) = CREDIT_CARD_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "CreditCard".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
+        for (idx, (pii_type, pattern)) in PII_PATTERNS.iter().enumerate() {
+            if let Some(present) = &present {
+                if !present.matched(idx) {
+                    continue;
+                }
             }
-        }
-
-        // API Key
-        if let Some(pattern) = API_KEY_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "APIKey".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
-            }
-        }
-
-        // Address
-        if let Some(pattern) = ADDRESS_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "Address".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
-            }
-        }
-
-        // DOB
-        if let Some(pattern) = DOB_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "DOB".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
-            }
-        }
-
-        // Passport
-        if let Some(pattern) = PASSPORT_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "Passport".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
-            }
-        }
-
-        // Biometric
-        if let Some(pattern) = BIOMETRIC_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "Biometric".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
-            }
-        }
-
-        // Drivers License
-        if let Some(pattern) = DRIVERS_LICENSE_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "DriversLicense".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
-            }
-        }
-
-        // Bank Account
-        if let Some(pattern) = BANK_ACCOUNT_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "BankAccount".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
-            }
-        }
-
-        // Medical
-        if let Some(pattern) = MEDICAL_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "Medical".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
-            }
-        }
-
-        // Digital ID
-        if let Some(pattern) = DIGITAL_ID_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "DigitalID".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
-            }
-        }
-
-        // Demographic
-        if let Some(pattern) = DEMOGRAPHIC_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "Demographic".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
-            }
-        }
-
-        // GPS
-        if let Some(pattern) = GPS_PATTERN.as_ref() {
-            for m in pattern.find_iter(text) {
-                matches.push(PIIMatch {
-                    pii_type: "GPS".to_string(),
-                    value: m.as_str().to_string(),
-                    start: m.start(),
-                    end: m.end(),
-                });
+            if let Some(pattern) = pattern.as_ref() {
+                for m in pattern.find_iter(text) {
+                    matches.push(PIIMatch {
+                        pii_type: pii_type.to_string(),
+                        value: m.as_str().to_string(),
+                        start: m.start(),
+                        end: m.end(),
+                    });
+                }
             }
         }
 
@@ -321,3 +192,58 @@ impl Default for PIIRedactor {
         Self::new('*')
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn spans(matches: Vec<PIIMatch>) -> Vec<(String, String, usize, usize)> {
+        matches
+            .into_iter()
+            .map(|m| (m.pii_type, m.value, m.start, m.end))
+            .collect()
+    }
+
+    #[test]
+    fn detect_pii_reports_by_type_then_position() {
+        let found = spans(
+            PIIRedactor::new('*')
+                .detect_pii("Contact bob@example.com or 555-123-4567, SSN 123-45-6789."),
+        );
+        let expected = [
+            ("Email", "bob@example.com", 8, 23),
+            ("Phone", "555-123-4567", 27, 39),
+            ("SSN", "123-45-6789", 45, 56),
+        ]
+        .map(|(t, v, s, e)| (t.to_string(), v.to_string(), s, e));
+        assert_eq!(found, expected);
+    }
+
+    #[test]
+    fn prefilter_matches_unfiltered_scan() {
+        let texts = [
+            "",
+            "The swarm converged after 300 ticks.",
+            "Contact bob@example.com or 555-123-4567, SSN 123-45-6789.",
+            "card 4111 1111 1111 1111, key sk-abcdefghijklmnopqrstuv, 12 Main Street, born 01/02/1990",
+            "passport A12345678, fingerprint on file, api_key=abcdefghijklmnop1234 at 40.7128,-74.0060",
+        ];
+        let redactor = PIIRedactor::new('*');
+        for text in texts {
+            // Reference: every pattern in order, no RegexSet prefilter
+            let mut unfiltered = Vec::new();
+            for (pii_type, pattern) in PII_PATTERNS.iter() {
+                for m in pattern.as_ref().unwrap().find_iter(text) {
+                    unfiltered.push((
+                        pii_type.to_string(),
+                        m.as_str().to_string(),
+                        m.start(),
+                        m.end(),
+                    ));
+                }
+            }
+            assert_eq!(spans(redactor.detect_pii(text)), unfiltered, "{text}");
+        }
+        assert!(PII_PREFILTER.is_some());
+    }
+}
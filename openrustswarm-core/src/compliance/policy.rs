@@ -56,7 +56,9 @@ pub struct PolicyResult {
 
 /// Policy engine for rule evaluation
 pub struct PolicyEngine {
-    policies: RwLock<Vec<Policy>>,
+    /// Each policy alongside its pattern, compiled once in `add_policy`
+    /// (`None` if the pattern is invalid, in which case it never matches)
+    policies: RwLock<Vec<(Policy, Option<Regex>)>>,
 }
 
 impl PolicyEngine {
@@ -112,8 +114,9 @@ impl PolicyEngine {
             priority: 0,
         };
 
+        let compiled = Regex::new(action_pattern).ok();
         let mut policies = self.policies.write();
-        policies.push(policy);
+        policies.push((policy, compiled));
     }
 
     pub fn evaluate(&self, _agent_id: &str, action: &str, data: &str) -> PolicyResult {
@@ -122,8 +125,8 @@ impl PolicyEngine {
         // Combine action and data for pattern matching
         let full_context = format!("{} {}", action, data);
 
-        for policy in policies.iter() {
-            if let Ok(re) = Regex::new(&policy.action_pattern) {
+        for (policy, pattern) in policies.iter() {
+            if let Some(re) = pattern {
                 if re.is_match(&full_context) {
                     return PolicyResult {
                         allowed: policy.allowed,
@@ -147,7 +150,7 @@ impl PolicyEngine {
     }
 
     pub fn list_policies(&self) -> Vec<Policy> {
-        self.policies.read().clone()
+        self.policies.read().iter().map(|(p, _)| p.clone()).collect()
     }
 }
 
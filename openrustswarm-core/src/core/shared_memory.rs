@@ -8,6 +8,9 @@ use tracing::info;
 #[pyclass]
 pub struct SharedMemoryStore {
     buffer: Arc<RwLock<Vec<f32>>>,
+    /// L2 norm of each stored vector, refreshed on `write`.
+    /// Always locked after `buffer` to keep lock order consistent.
+    norms: Arc<RwLock<Vec<f64>>>,
     vector_size: usize,
     capacity: usize,
 }
@@ -24,6 +27,7 @@ impl SharedMemoryStore {
 
         SharedMemoryStore {
             buffer: Arc::new(RwLock::new(vec![0.0; total_size])),
+            norms: Arc::new(RwLock::new(vec![0.0; capacity])),
             vector_size,
             capacity,
         }
@@ -53,9 +57,12 @@ impl SharedMemoryStore {
 
         let mut data = self.buffer.write();
         let start = index * self.vector_size;
+        let mut sq_norm = 0.0_f64;
         for (i, val) in vector.into_iter().enumerate() {
             data[start + i] = val;
+            sq_norm += (val as f64) * (val as f64);
         }
+        self.norms.write()[index] = sq_norm.sqrt();
 
         Ok(())
     }
@@ -91,12 +98,14 @@ impl SharedMemoryStore {
     pub fn fork(&self) -> Self {
         SharedMemoryStore {
             buffer: self.buffer.clone(),
+            norms: self.norms.clone(),
             vector_size: self.vector_size,
             capacity: self.capacity,
         }
     }
 
     /// Compute cosine similarity between two vectors at given indices.
+    /// Magnitudes come from the per-slot norm cache, so only the dot product is computed here.
     pub fn cosine_similarity(&self, index_a: usize, index_b: usize) -> PyResult<f64> {
         if index_a >= self.capacity || index_b >= self.capacity {
             return Err(pyo3::exceptions::PyIndexError::new_err(
@@ -105,26 +114,50 @@ impl SharedMemoryStore {
         }
 
         let data = self.buffer.read();
+        let denom = {
+            let norms = self.norms.read();
+            norms[index_a] * norms[index_b]
+        };
+        if denom == 0.0 {
+            return Ok(0.0);
+        }
+
         let start_a = index_a * self.vector_size;
         let start_b = index_b * self.vector_size;
 
         let mut dot = 0.0_f64;
-        let mut mag_a = 0.0_f64;
-        let mut mag_b = 0.0_f64;
-
         for i in 0..self.vector_size {
-            let a = data[start_a + i] as f64;
-            let b = data[start_b + i] as f64;
-            dot += a * b;
-            mag_a += a * a;
-            mag_b += b * b;
-        }
-
-        let denom = mag_a.sqrt() * mag_b.sqrt();
-        if denom == 0.0 {
-            return Ok(0.0);
+            dot += data[start_a + i] as f64 * data[start_b + i] as f64;
         }
 
         Ok(dot / denom)
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn cosine_uses_refreshed_norms_after_overwrite() {
+        let store = SharedMemoryStore::new(2, 2);
+        store.write(0, vec![1.0, 0.0]).unwrap();
+        store.write(1, vec![1.0, 0.0]).unwrap();
+        assert!((store.cosine_similarity(0, 1).unwrap() - 1.0).abs() < 1e-9);
+
+        store.write(1, vec![3.0, 4.0]).unwrap();
+        assert!((store.cosine_similarity(0, 1).unwrap() - 0.6).abs() < 1e-9);
+
+        // Forks share both the buffer and the norm cache
+        let fork = store.fork();
+        fork.write(1, vec![0.0, 2.0]).unwrap();
+        assert!(store.cosine_similarity(0, 1).unwrap().abs() < 1e-9);
+    }
+
+    #[test]
+    fn cosine_of_empty_slot_is_zero() {
+        let store = SharedMemoryStore::new(2, 3);
+        store.write(0, vec![1.0, 2.0, 3.0]).unwrap();
+        assert_eq!(store.cosine_similarity(0, 1).unwrap(), 0.0);
+    }
+}
@@ -6,11 +6,28 @@
 //! - calculate: Evaluate mathematical expressions
 //! - finish: Signal task completion with final answer
 
+use regex::Regex;
 use reqwest::Client;
 use serde::{Deserialize, Serialize};
 use std::env;
+use std::sync::LazyLock;
 use tracing::info;
 
+/// Search patterns, compiled once instead of on every tool call
+static TICKER_PATTERN: LazyLock<Option<Regex>> =
+    LazyLock::new(|| Regex::new(r"\b([A-Z]{2,5})\b").ok());
+
+static GOOGLE_LINK_PATTERN: LazyLock<Option<Regex>> = LazyLock::new(|| {
+    Regex::new(r#"(?i)<a[^>]*href="/url\?q=([^&"]+)[^>]*>(.*?)</a>"#).ok()
+});
+
+static DDG_LINK_PATTERN: LazyLock<Option<Regex>> = LazyLock::new(|| {
+    Regex::new(r#"(?i)result-link"[^>]*href="([^"]+)"[^>]*>(.*?)</a>"#).ok()
+});
+
+static DDG_SNIPPET_PATTERN: LazyLock<Option<Regex>> =
+    LazyLock::new(|| Regex::new(r#"(?i)result-snippet"[^>]*>([^<]+)"#).ok());
+
 /// Tool execution result
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub enum ToolResult {
@@ -96,9 +113,8 @@ pub async fn web_search(client: &Client, query: &str) -> ToolResult {
     let query_lower = query.to_lowercase();
 
     // Extract potential ticker using regex (2-5 uppercase letters)
-    let ticker_regex = match regex::Regex::new(r"\b([A-Z]{2,5})\b") {
-        Ok(r) => r,
-        Err(e) => return ToolResult::Error(format!("Regex error: {}", e)),
+    let Some(ticker_regex) = TICKER_PATTERN.as_ref() else {
+        return ToolResult::Error("Regex error: invalid ticker pattern".to_string());
     };
     let common_words = [
         "THE", "AND", "FOR", "ARE", "BUT", "NOT", "YOU", "ALL", "CAN", "HER", "WAS", "ONE", "OUR",
@@ -259,7 +275,7 @@ pub async fn web_search(client: &Client, query: &str) -> ToolResult {
             if let Ok(html) = resp.text().await {
                 let mut results = Vec::new();
                 // Improved Google Lite regex
-                let link_re = match regex::Regex::new(r#"(?i)<a[^>]*href="/url\?q=([^&"]+)[^>]*>(.*?)</a>"#) { Ok(r) => r, Err(e) => return ToolResult::Error(format!("Regex error: {}", e)) };
+                let Some(link_re) = GOOGLE_LINK_PATTERN.as_ref() else { return ToolResult::Error("Regex error: invalid Google link pattern".to_string()) };
 
                 for cap in link_re.captures_iter(&html).take(10) {
                     let link = urlencoding::decode(&cap[1]).unwrap_or(std::borrow::Cow::Borrowed(&cap[1])).to_string();
@@ -291,8 +307,8 @@ pub async fn web_search(client: &Client, query: &str) -> ToolResult {
     {
         if let Ok(html) = resp.text().await {
             let mut results = Vec::new();
-            let link_re = match regex::Regex::new(r#"(?i)result-link"[^>]*href="([^"]+)"[^>]*>(.*?)</a>"#) { Ok(r) => r, Err(e) => return ToolResult::Error(format!("Regex error: {}", e)) };
-            let snippet_re = match regex::Regex::new(r#"(?i)result-snippet"[^>]*>([^<]+)"#) { Ok(r) => r, Err(e) => return ToolResult::Error(format!("Regex error: {}", e)) };
+            let Some(link_re) = DDG_LINK_PATTERN.as_ref() else { return ToolResult::Error("Regex error: invalid DuckDuckGo link pattern".to_string()) };
+            let Some(snippet_re) = DDG_SNIPPET_PATTERN.as_ref() else { return ToolResult::Error("Regex error: invalid DuckDuckGo snippet pattern".to_string()) };
 
             let links: Vec<_> = link_re.captures_iter(&html).map(|c| (c[1].to_string(), c[2].to_string())).collect();
             let snippets: Vec<_> = snippet_re.captures_iter(&html).map(|c| c[1].to_string()).collect();
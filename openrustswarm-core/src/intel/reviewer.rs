@@ -1,8 +1,21 @@
 use crate::core::middleware::{CogOpsContext, Middleware};
 use pyo3::prelude::*;
 use regex::Regex;
+use std::sync::LazyLock;
 use tracing::info;
 
+/// Secret patterns, compiled once instead of on every review
+static SECRET_KEY_PATTERN: LazyLock<Option<Regex>> =
+    LazyLock::new(|| Regex::new(r"sk-[a-zA-Z0-9]{20,}").ok());
+
+static API_KEY_ASSIGNMENT_PATTERN: LazyLock<Option<Regex>> =
+    LazyLock::new(|| Regex::new(r#"API_KEY\s*=\s*['"][^'"]+['"]"#).ok());
+
+/// Log calls counted as console spam (JS, tracing macros, Python), matched in one pass
+static LOG_CALL_PATTERN: LazyLock<Option<Regex>> = LazyLock::new(|| {
+    Regex::new(r"console\.log|info!\(|warn!\(|error!\(|debug!\(|trace!\(|print\(").ok()
+});
+
 /// Code Quality Guard - Reviews code for secrets, TODOs, and console spam.
 #[pyclass]
 pub struct CodeQualityGuard {}
@@ -19,7 +32,7 @@ impl CodeQualityGuard {
         let mut issues: Vec<String> = Vec::new();
 
         // 1. Check for secrets
-        if let Ok(re) = Regex::new(r"sk-[a-zA-Z0-9]{20,}") {
+        if let Some(re) = SECRET_KEY_PATTERN.as_ref() {
             if re.is_match(&content) {
                 issues.push(
                     "Hardcoded API Secret detected! Use environment variables instead.".to_string(),
@@ -27,7 +40,7 @@ impl CodeQualityGuard {
             }
         }
 
-        if let Ok(re) = Regex::new(r#"API_KEY\s*=\s*['"][^'"]+['"]"#) {
+        if let Some(re) = API_KEY_ASSIGNMENT_PATTERN.as_ref() {
             if re.is_match(&content) {
                 issues.push(
                     "Hardcoded API_KEY detected! Use environment variables instead.".to_string(),
@@ -44,13 +57,9 @@ impl CodeQualityGuard {
         }
 
         // 3. Check for console spam
-        let log_count = content.matches("console.log").count()
-            + content.matches("info!(").count() // Replaced println! with tracing info!
-            + content.matches("warn!(").count() // Added tracing warn!
-            + content.matches("error!(").count() // Added tracing error!
-            + content.matches("debug!(").count() // Added tracing debug!
-            + content.matches("trace!(").count() // Added tracing trace!
-            + content.matches("print(").count();
+        let log_count = LOG_CALL_PATTERN
+            .as_ref()
+            .map_or(0, |re| re.find_iter(&content).count());
         if log_count > 5 {
             issues.push(format!(
                 "Too many log statements ({}). Clean up debug code.",
@@ -4,6 +4,7 @@
 //! Tiers: Dormant (bitflag), Simplified (cache-friendly SIMD), Full Fidelity (TensorSwarm), Heavy (LLM).
 
 use crate::swarm::tensor_engine::TensorSwarm;
+use numpy::{PyArray1, PyArray2, PyArrayMethods};
 use pyo3::prelude::*;
 
 /// Tier 1: Dormant Agent
@@ -180,4 +181,50 @@ impl ProductionTensorSwarm {
     pub fn pop_promotions(&mut self) -> Vec<u32> {
         self.active.pop_promotions()
     }
+
+    /// Register tracking locations on the active tier
+    pub fn register_locations(
+        &mut self,
+        villages: Vec<(f32, f32)>,
+        towns: Vec<(f32, f32)>,
+        cities: Vec<(f32, f32)>,
+        ambush_zones: Vec<(f32, f32)>,
+    ) {
+        self.active.register_locations(villages, towns, cities, ambush_zones);
+    }
+
+    /// Apply an environmental shock on the active tier
+    pub fn apply_environmental_shock(&mut self, location: (f32, f32), radius: f32, intensity: f32) {
+        self.active.apply_environmental_shock(location, radius, intensity);
+    }
+
+    /// Active-tier population metrics snapshot (see `TensorSwarm::sample_population_metrics`)
+    pub fn sample_population_metrics(&self) -> PyObject {
+        self.active.sample_population_metrics()
+    }
+
+    /// Active-tier health column
+    pub fn get_all_health(&self) -> Vec<f32> {
+        self.active.health.clone()
+    }
+
+    /// Active-tier positions as a `(2, n)` float32 NumPy array: row 0 is x, row 1 is y.
+    /// One memcpy per column straight into the array buffer, no Python float objects.
+    pub fn get_all_positions_np<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyArray2<f32>>> {
+        let n = self.active.x.len();
+        let mut flat = Vec::with_capacity(2 * n);
+        flat.extend_from_slice(&self.active.x);
+        flat.extend_from_slice(&self.active.y);
+        PyArray1::from_vec_bound(py, flat).reshape([2, n])
+    }
+
+    /// Active-tier health column as a float32 NumPy array
+    pub fn get_all_health_np<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f32>> {
+        PyArray1::from_slice_bound(py, &self.active.health)
+    }
+
+    /// Active-tier TD-RL share probability column as a float32 NumPy array
+    pub fn get_all_share_probabilities_np<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<f32>> {
+        PyArray1::from_slice_bound(py, &self.active.share_probabilities)
+    }
 }
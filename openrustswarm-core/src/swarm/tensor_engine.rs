@@ -298,6 +298,11 @@ impl TensorSwarm {
             let sum: f32 = self.surprise_scores.iter().sum();
             let mean = if self.surprise_scores.is_empty() { 0.0 } else { sum / self.surprise_scores.len() as f32 };
             dict.set_item("mean_surprise_score", mean).unwrap();
+
+            // Mean health (parallel reduction, so callers need not pull the column)
+            let health_sum: f32 = self.health.par_iter().sum();
+            let mean_health = if self.health.is_empty() { 0.0 } else { health_sum / self.health.len() as f32 };
+            dict.set_item("mean_health", mean_health).unwrap();
             
             dict.into()
         })